@@ -0,0 +1,44 @@
+"""Score aggregation kernels.
+
+Kept out of app.py because Streamlit re-executes the app script on every rerun,
+while this module is imported (and compiled, when numba is available) only once.
+"""
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+def _segment_means_numpy(values: np.ndarray, present: np.ndarray, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Average the filled values of each segment, returning means and filled counts"""
+    sums = np.add.reduceat(values * present, starts)
+    counts = np.add.reduceat(present, starts)
+    return np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0), counts
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def segment_means(values, present, starts):
+        """Compiled equivalent of _segment_means_numpy"""
+        n_segments = starts.shape[0]
+        means = np.zeros(n_segments)
+        counts = np.zeros(n_segments)
+        for s in range(n_segments):
+            end = starts[s + 1] if s + 1 < n_segments else values.shape[0]
+            total = 0.0
+            for i in range(starts[s], end):
+                total += values[i] * present[i]
+                counts[s] += present[i]
+            if counts[s] > 0:
+                means[s] = total / counts[s]
+        return means, counts
+
+    # Compile at import so the first scoring rerun doesn't pay for it
+    segment_means(np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.intp))
+else:
+    segment_means = _segment_means_numpy
@@ -1,17 +1,112 @@
 import streamlit as st
+import numpy as np
+import pandas as pd
 import json
 import os
 from pathlib import Path
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from functools import lru_cache
 
-from utils import load_question_files, grade_to_value
+from utils import load_question_files as _load_question_files, grade_to_value
+from aggregation import segment_means
 
 # Constants
 GRADE_MAPPING = {'A': 0, 'B': 1, 'C': 2, 'D': 3, 'E': 4, 'F': 5, 'G': 6}
 LETTER_MAPPING = ['A', 'B', 'C', 'D', 'E', 'F', 'G']
 
+# Byte lookup table from character code to grade, so option IDs are graded by indexing
+_GRADE_LUT = bytes(GRADE_MAPPING.get(chr(code), 0) for code in range(256))
+_GRADE_ARRAY = np.frombuffer(_GRADE_LUT, dtype=np.uint8)
+
+def option_id_to_code(option_id: str) -> int:
+    """Convert option ID to the single-byte code used for grade lookups"""
+    if not option_id:
+        return 0
+    code = ord(option_id[0])
+    # Clearing bit 5 folds lowercase ASCII letters onto uppercase
+    return code & 0xDF if code < 256 else 0
+
+def grade_to_letter(grade: float) -> str:
+    """Convert numerical grade to letter"""
+    if 0 <= grade <= 6:
+        return LETTER_MAPPING[int(round(grade))]
+    return 'A'
+
+def _build_display_options(question: Dict) -> Tuple[Tuple[str, ...], Dict[str, Dict]]:
+    """Build the radio labels and label-to-option mapping for a question"""
+    option_mapping = {}
+    for option in question['answer_options']:
+        if option['option_text'].strip():
+            option_mapping[f"({option['option_id']}) -- {option['option_text']}"] = option
+    return tuple(option_mapping), option_mapping
+
+QUESTIONS_DIR = Path(__file__).parent / "questions"
+
+def question_files_signature() -> Tuple[Tuple[str, int], ...]:
+    """(name, mtime) of every question file; the caches below are keyed on it so edits show up"""
+    return tuple((path.name, path.stat().st_mtime_ns) for path in sorted(QUESTIONS_DIR.glob("*.json")))
+
+@st.cache_resource(max_entries=1)
+def _load_question_files_cached(signature: Tuple[Tuple[str, int], ...]) -> Dict:
+    """Parse the question files once per signature, shared across reruns and sessions"""
+    question_files = _load_question_files()
+    
+    # Fill in optional fields and precompute titles, session-state keys and radio options,
+    # so render and scoring code can index directly instead of rebuilding them per rerun
+    for page_key, data in question_files.items():
+        data.setdefault('questionnaire_info', {})
+        data['_title'] = data['questionnaire_info'].get('title', page_key)
+        for collection in data.setdefault('question_collections', []):
+            collection_id = collection['collection_id']
+            prefix = f"{page_key}_{collection_id}"
+            collection['_prefix'] = prefix
+            for i, question in enumerate(collection.setdefault('questions', [])):
+                question.setdefault('question_id', f"{collection_id}_{i}")
+                question.setdefault('subquestion', None)
+                question.setdefault('guidance', None)
+                question.setdefault('answer_options', [])
+                question.setdefault('followup_questions', [])
+                question['_storage_key'] = f"{prefix}_{i}"
+                question['_display_options'] = _build_display_options(question)
+    
+    return question_files
+
+def load_question_files() -> Dict:
+    """Load the question files, reparsing them only when they change on disk"""
+    return _load_question_files_cached(question_files_signature())
+
+@dataclass
+class AnswerStore:
+    """Answers held as parallel arrays; position i of every field belongs to the same answer"""
+    keys: List[str] = field(default_factory=list)
+    options: List[Dict] = field(default_factory=list)
+    option_codes: bytearray = field(default_factory=bytearray)
+    meta: List[Tuple[str, str, int]] = field(default_factory=list)
+    index: Dict[str, int] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def set(self, key: str, option: Dict, meta: Tuple[str, str, int]):
+        """Insert or overwrite the answer stored under key"""
+        code = option_id_to_code(option['option_id'])
+        position = self.index.get(key)
+        if position is None:
+            self.index[key] = len(self.keys)
+            self.keys.append(key)
+            self.options.append(option)
+            self.option_codes.append(code)
+            self.meta.append(meta)
+        else:
+            self.options[position] = option
+            self.option_codes[position] = code
+    
+    def grades(self) -> np.ndarray:
+        """Numerical grade of every stored answer, in store order"""
+        return _GRADE_ARRAY[np.frombuffer(self.option_codes, dtype=np.uint8)]
+
 @dataclass
 class ScoreData:
     """Centralized score data structure"""
@@ -24,25 +119,69 @@ class QuestionnaireProcessor:
     
     def __init__(self, question_files: Dict):
         self.question_files = question_files
-        self._score_cache = None
-    
-    @staticmethod
-    def option_id_to_grade(option_id: str) -> int:
-        """Convert option ID to numerical grade"""
-        return GRADE_MAPPING.get(option_id.upper(), 0)
-    
-    @staticmethod
-    def grade_to_letter(grade: float) -> str:
-        """Convert numerical grade to letter"""
-        if 0 <= grade <= 6:
-            return LETTER_MAPPING[int(round(grade))]
-        return 'A'
+        # (answers key, result) pair, replaced as a whole since the processor is shared across sessions
+        self._score_cache: Optional[Tuple[Tuple, 'ScoreData']] = None
+        
+        # Build lookup indexes once so scoring doesn't rescan the question files
+        self._answer_key_index: Dict[str, str] = {}
+        self._collection_to_questions: Dict[str, List[str]] = {}
+        self._value_to_collections: Dict[str, List[str]] = {}
+        
+        for page_data in question_files.values():
+            value_collections = self._value_to_collections.setdefault(page_data['_title'], [])
+            
+            for collection in page_data['question_collections']:
+                collection_id = collection['collection_id']
+                value_collections.append(collection_id)
+                question_ids = self._collection_to_questions.setdefault(collection_id, [])
+                
+                for question in collection['questions']:
+                    question_id = question['question_id']
+                    self._answer_key_index[question['_storage_key']] = question_id
+                    question_ids.append(question_id)
+        
+        # Integer layout for vectorized aggregation: each criterion is a contiguous segment of
+        # indicator positions, and each value is a segment of criterion positions. A question ID
+        # shared by several collections has one indicator position but a slot in every segment.
+        self._indicator_index: Dict[str, int] = {}
+        self._criterion_index: Dict[str, int] = {}
+        segment_starts = []
+        member_indicators = []
+        for collection_id, question_ids in self._collection_to_questions.items():
+            if not question_ids:
+                continue
+            self._criterion_index[collection_id] = len(segment_starts)
+            segment_starts.append(len(member_indicators))
+            for question_id in question_ids:
+                member_indicators.append(self._indicator_index.setdefault(question_id, len(self._indicator_index)))
+        self._criterion_ids = list(self._criterion_index)
+        self._segment_starts = np.array(segment_starts, dtype=np.intp)
+        self._criterion_member_indicators = np.array(member_indicators, dtype=np.intp)
+        
+        self._value_names = []
+        value_starts = []
+        member_criteria = []
+        for value_name, collection_ids in self._value_to_collections.items():
+            positions = [self._criterion_index[cid] for cid in collection_ids if cid in self._criterion_index]
+            if not positions:
+                continue
+            self._value_names.append(value_name)
+            value_starts.append(len(member_criteria))
+            member_criteria.extend(positions)
+        self._value_starts = np.array(value_starts, dtype=np.intp)
+        self._value_member_criteria = np.array(member_criteria, dtype=np.intp)
     
-    def calculate_all_scores(self, answers: Dict) -> ScoreData:
+    def calculate_all_scores(self, answers: AnswerStore) -> ScoreData:
         """Calculate all scores efficiently in one pass"""
         if not answers:
             return ScoreData({}, {}, {})
         
+        # Reuse the previous result if the answers haven't changed since the last call
+        cache_key = (tuple(answers.keys), bytes(answers.option_codes))
+        cached = self._score_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        
         # Calculate indicator scores
         indicator_scores = self._calculate_indicator_scores(answers)
         
@@ -52,93 +191,70 @@ class QuestionnaireProcessor:
         # Calculate value scores (questionnaires)
         value_scores = self._calculate_value_scores(criterion_scores)
 
-        # add caching for performance
-        self._score_cache = (indicator_scores, criterion_scores, value_scores)
-
+        score_data = ScoreData(indicator_scores, criterion_scores, value_scores)
+        self._score_cache = (cache_key, score_data)
         
-        return ScoreData(indicator_scores, criterion_scores, value_scores)
+        return score_data
     
-    def _calculate_indicator_scores(self, answers: Dict) -> Dict[str, int]:
+    def _calculate_indicator_scores(self, answers: AnswerStore) -> Dict[str, int]:
         """Calculate scores for each indicator (question)"""
-        indicator_scores = {}
-        
-        for answer_key, answer_data in answers.items():
-            parts = answer_key.split('_')
-            if len(parts) < 3:
-                continue
-                
-            page_key, collection_id, question_index = parts[0], parts[1], int(parts[2])
-            
-            # Find the question to get its ID
-            if page_key in self.question_files:
-                collections = self.question_files[page_key]['question_collections']
-                for collection in collections:
-                    if collection['collection_id'] == collection_id:
-                        if question_index < len(collection['questions']):
-                            question = collection['questions'][question_index]
-                            question_id = question.get('question_id', f"{collection_id}_{question_index}")
-                            grade = self.option_id_to_grade(answer_data['option_id'])
-                            indicator_scores[question_id] = grade
-                            break
-        
-        return indicator_scores
+        grades = answers.grades().tolist()
+        return {
+            self._answer_key_index[key]: grade
+            for key, grade in zip(answers.keys, grades)
+            if key in self._answer_key_index
+        }
+    
+    @staticmethod
+    def _scatter(scores: Dict[str, float], index: Dict[str, int], size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Place scores into a dense array, returning it with a mask of filled positions"""
+        values = np.zeros(size, dtype=np.float64)
+        present = np.zeros(size, dtype=np.float64)
+        positions = np.fromiter((index[k] for k in scores), dtype=np.intp, count=len(scores))
+        values[positions] = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+        present[positions] = 1.0
+        return values, present
     
     def _calculate_criterion_scores(self, indicator_scores: Dict[str, int]) -> Dict[str, float]:
         """Calculate criterion scores (average of indicators within each collection)"""
-        criterion_scores = {}
+        # Nothing to aggregate if no answer matched a known question
+        if not indicator_scores or not self._criterion_ids:
+            return {}
         
-        for page_key, page_data in self.question_files.items():
-            collections = page_data.get('question_collections', [])
-            
-            for collection in collections:
-                collection_id = collection['collection_id']
-                questions = collection.get('questions', [])
-                
-                # Get scores for all questions in this collection
-                scores = []
-                for question in questions:
-                    question_id = question.get('question_id')
-                    if question_id and question_id in indicator_scores:
-                        scores.append(indicator_scores[question_id])
-                
-                if scores:
-                    criterion_scores[collection_id] = sum(scores) / len(scores)
+        scores, answered = self._scatter(indicator_scores, self._indicator_index, len(self._indicator_index))
+        means, counts = segment_means(
+            scores[self._criterion_member_indicators], answered[self._criterion_member_indicators], self._segment_starts
+        )
         
-        return criterion_scores
+        return {self._criterion_ids[i]: float(means[i]) for i in np.flatnonzero(counts)}
     
     def _calculate_value_scores(self, criterion_scores: Dict[str, float]) -> Dict[str, float]:
         """Calculate value scores (average of criteria within each questionnaire)"""
-        value_scores = {}
+        if not criterion_scores or not self._value_names:
+            return {}
         
-        for page_key, page_data in self.question_files.items():
-            value_name = page_data.get('questionnaire_info', {}).get('title', page_key)
-            collections = page_data.get('question_collections', [])
-            
-            # Get scores for all collections in this questionnaire
-            scores = []
-            for collection in collections:
-                collection_id = collection['collection_id']
-                if collection_id in criterion_scores:
-                    scores.append(criterion_scores[collection_id])
-            
-            if scores:
-                value_scores[value_name] = sum(scores) / len(scores)
+        scores, answered = self._scatter(criterion_scores, self._criterion_index, len(self._criterion_ids))
+        means, counts = segment_means(
+            scores[self._value_member_criteria], answered[self._value_member_criteria], self._value_starts
+        )
         
-        return value_scores
+        return {self._value_names[i]: float(means[i]) for i in np.flatnonzero(counts)}
     
-    def get_progress_data(self, answers: Dict) -> Dict:
-        """Calculate progress statistics for all questionnaires"""
+    def get_progress_data(self, answer_meta: List[Tuple[str, str, int]]) -> Dict:
+        """Calculate progress statistics for all questionnaires from the parsed answer keys"""
         progress_data = {}
         total_all = answered_all = 0
         
+        # Bucket answers by (page, collection) in a single pass
+        answered_counts = Counter((page, collection) for page, collection, _ in answer_meta)
+        
         for page_name, page_data in self.question_files.items():
             total_questions = answered_questions = 0
             
             for collection in page_data['question_collections']:
                 collection_id = collection['collection_id']
                 collection_total = len(collection['questions'])
-                collection_answered = len([k for k in answers.keys() 
-                                         if k.startswith(f"{page_name}_{collection_id}")])
+                collection_answered = answered_counts.get((page_name, collection_id), 0)
                 
                 total_questions += collection_total
                 answered_questions += collection_answered
@@ -160,11 +276,21 @@ class QuestionnaireProcessor:
         
         return progress_data
 
+@st.cache_resource(max_entries=1)
+def _get_processor_cached(signature: Tuple[Tuple[str, int], ...]) -> QuestionnaireProcessor:
+    """Build the questionnaire processor once per question files signature"""
+    return QuestionnaireProcessor(_load_question_files_cached(signature))
+
+def get_processor() -> QuestionnaireProcessor:
+    """Get the shared processor, rebuilt only when the question files change on disk"""
+    return _get_processor_cached(question_files_signature())
+
 def initialize_session_state():
     """Initialize session state variables"""
     defaults = {
         'current_question': {},
-        'answers': {},
+        'answers': AnswerStore(),
+        'confirm_reset': False,
         'current_page': None
     }
     
@@ -177,42 +303,33 @@ def display_question(question: Dict, question_key: int, page_key: str, collectio
     st.markdown(f"### {question['question_text']}")
     st.caption(f"Question ID: {question['question_id']}")
     
-    if question.get('subquestion'):
+    if question['subquestion']:
         st.caption(question['subquestion'])
     
-    if question.get('guidance'):
+    if question['guidance']:
         st.markdown(f"*{question['guidance']}*")
     
-    answer_options = question.get('answer_options', [])
-    if not answer_options:
+    if not question['answer_options']:
         st.warning("No answer options available for this question.")
         return
     
-    # Create display options
-    display_options = []
-    option_mapping = {}
-    
-    for option in answer_options:
-        if option['option_text'].strip():
-            display_text = f"({option['option_id']}) -- {option['option_text']}"
-            display_options.append(display_text)
-            option_mapping[display_text] = option
-    
+    display_options, option_mapping = question['_display_options']
     if not display_options:
         st.warning("No valid answer options available for this question.")
         return
     
     # Create unique key and handle selection
-    unique_key = f"{page_key}_{collection_id}_{question_key}_answer"
-    selected_answer = st.radio("Select your answer:", display_options, key=unique_key, index=None)
+    answer_storage_key = question['_storage_key']
+    selected_answer = st.radio("Select your answer:", display_options, key=f"{answer_storage_key}_answer", index=None)
     
     # Store answer
-    answer_storage_key = f"{page_key}_{collection_id}_{question_key}"
     if selected_answer:
-        st.session_state.answers[answer_storage_key] = option_mapping[selected_answer]
+        st.session_state.answers.set(
+            answer_storage_key, option_mapping[selected_answer], (page_key, collection_id, question_key)
+        )
         
         # Display follow-up questions
-        followup_questions = question.get('followup_questions', [])
+        followup_questions = question['followup_questions']
         if followup_questions:
             st.write("**Follow-up questions:**")
             for followup in followup_questions:
@@ -232,7 +349,7 @@ def display_collection(collection: Dict, page_key: str):
         return
     
     # Initialize current question index
-    collection_key = f"{page_key}_{collection_id}"
+    collection_key = collection['_prefix']
     if collection_key not in st.session_state.current_question:
         st.session_state.current_question[collection_key] = 0
     
@@ -261,33 +378,34 @@ def display_collection(collection: Dict, page_key: str):
             st.rerun()
         
         if st.button("💾 Save Answers", key=f"{collection_key}_save", type="primary"):
-            collection_answers = [k for k in st.session_state.answers.keys() 
-                                if k.startswith(f"{page_key}_{collection_id}")]
+            collection_answers = [meta for meta in st.session_state.answers.meta
+                                  if meta[0] == page_key and meta[1] == collection_id]
             if not collection_answers:
                 st.warning("No answers recorded for this collection yet.")
                 return
             # Save answers to session state
             st.success(f"Answers saved!")
 
-def display_score_section(title: str, scores: Dict, emoji: str):
+def _score_formatter(is_float_section: bool):
+    """Pick the score formatter for a section; averaged scores are floats, indicator grades are ints"""
+    return "{:.2f}".format if is_float_section else str
+
+def display_score_section(title: str, scores: Dict, emoji: str, is_float_section: bool):
     """Display a section of scores in a consistent format"""
     if not scores:
         return
         
     st.subheader(f"{emoji} {title}")
-    processor = QuestionnaireProcessor({})  # Empty init for static method access
+    fmt = _score_formatter(is_float_section)
     
     for name, score in scores.items():
         col1, col2, col3 = st.columns([2, 1, 1])
         with col1:
             st.write(f"**{name}**")
         with col2:
-            if isinstance(score, float):
-                st.write(f"Score: {score:.2f}")
-            else:
-                st.write(f"Score: {score}")
+            st.write(f"Score: {fmt(score)}")
         with col3:
-            st.write(f"Grade: {processor.grade_to_letter(score)}")
+            st.write(f"Grade: {grade_to_letter(score)}")
     
     st.write("---")
 
@@ -301,36 +419,34 @@ def summary_page():
         return
     
     # Initialize processor and calculate scores
-    question_files = load_question_files()
-    processor = QuestionnaireProcessor(question_files)
+    processor = get_processor()
     score_data = processor.calculate_all_scores(st.session_state.answers)
     overall_score = sum(score_data.value_scores.values())/len(score_data.value_scores) if score_data.value_scores else 0
     
     # Display results
-    st.subheader(f"🏁 Overall Grade: {processor.grade_to_letter(overall_score)} (Score: {overall_score:.2f})")
-    display_score_section("Value Scores", score_data.value_scores, "🎯")
-    display_score_section("Criterion Scores", score_data.criterion_scores, "🔍")
-    display_score_section("Indicator Scores", score_data.indicator_scores, "📋")
+    st.subheader(f"🏁 Overall Grade: {grade_to_letter(overall_score)} (Score: {overall_score:.2f})")
+    display_score_section("Value Scores", score_data.value_scores, "🎯", is_float_section=True)
+    display_score_section("Criterion Scores", score_data.criterion_scores, "🔍", is_float_section=True)
+    display_score_section("Indicator Scores", score_data.indicator_scores, "📋", is_float_section=False)
     
     # Detailed answers section
     st.header("📝 Detailed Answers")
     with st.expander("View All Individual Answers", expanded=False):
-        for key, answer in st.session_state.answers.items():
-            parts = key.split('_')
-            if len(parts) >= 3:
-                page_key, collection_id, question_index = parts[0], parts[1], parts[2]
-                
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.write(f"**{page_key} - {collection_id} - Question {int(question_index) + 1}:**")
-                    st.write(f"{answer['option_text']}")
-                with col2:
-                    grade = processor.option_id_to_grade(answer['option_id'])
-                    st.write(f"Grade: {answer['option_id']} ({grade})")
-                st.write("---")
+        # One table instead of a row of widgets per answer
+        answers = st.session_state.answers
+        pages, collection_ids, question_indexes = zip(*answers.meta)
+        answers_table = pd.DataFrame({
+            'Page': pages,
+            'Collection': collection_ids,
+            'Question': np.array(question_indexes) + 1,
+            'Answer': [answer['option_text'] for answer in answers.options],
+            'Option': [answer['option_id'] for answer in answers.options],
+            'Grade': answers.grades(),
+        })
+        st.dataframe(answers_table, hide_index=True)
     
     # Export section
-    _display_export_section(score_data, processor)
+    _display_export_section(score_data)
 
     # Display progress overview and reset functionality in the sidebar
     with st.sidebar:
@@ -338,7 +454,7 @@ def summary_page():
         _display_reset_section()
 
 
-def _display_export_section(score_data: ScoreData, processor: QuestionnaireProcessor):
+def _display_export_section(score_data: ScoreData):
     """Display export functionality"""
     st.header("💾 Export Results")
     
@@ -348,18 +464,16 @@ def _display_export_section(score_data: ScoreData, processor: QuestionnaireProce
         if st.button("📋 Copy Results to Clipboard"):
             results_text = "VDE Spec 90012 Evaluation Results\n\n"
             
-            for section_name, scores in [
-                ("Value Scores", score_data.value_scores),
-                ("Criterion Scores", score_data.criterion_scores),
-                ("Indicator Scores", score_data.indicator_scores)
+            for section_name, scores, is_float_section in [
+                ("Value Scores", score_data.value_scores, True),
+                ("Criterion Scores", score_data.criterion_scores, True),
+                ("Indicator Scores", score_data.indicator_scores, False)
             ]:
                 if scores:
+                    fmt = _score_formatter(is_float_section)
                     results_text += f"{section_name}:\n"
                     for name, score in scores.items():
-                        if isinstance(score, float):
-                            results_text += f"- {name}: {score:.2f} (Grade: {processor.grade_to_letter(score)})\n"
-                        else:
-                            results_text += f"- {name}: {score} (Grade: {processor.grade_to_letter(score)})\n"
+                        results_text += f"- {name}: {fmt(score)} (Grade: {grade_to_letter(score)})\n"
                     results_text += "\n"
             
             st.code(results_text, language=None)
@@ -373,7 +487,7 @@ def _display_progress_section(processor: QuestionnaireProcessor):
     """Display progress overview"""
     st.header("📈 Progress Overview")
     
-    progress_data = processor.get_progress_data(st.session_state.answers)
+    progress_data = processor.get_progress_data(st.session_state.answers.meta)
     
     for page_name, stats in progress_data.items():
         if page_name == 'overall':
@@ -398,23 +512,38 @@ def _display_reset_section():
     """Display reset functionality"""
     st.header("🔄 Reset Data")
     if st.button("Reset All Answers", type="secondary"):
-        if st.button("⚠️ Confirm Reset", type="primary"):
-            st.session_state.answers = {}
-            st.session_state.current_question = {}
-            st.rerun()
+        st.session_state.confirm_reset = True
+    
+    # The confirmation has to survive the rerun triggered by the first click
+    if st.session_state.confirm_reset:
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("⚠️ Confirm Reset", type="primary"):
+                st.session_state.answers = AnswerStore()
+                st.session_state.current_question = {}
+                st.session_state.confirm_reset = False
+                # Drop the radio selections too, otherwise display_question re-stores them on the rerun
+                for data in load_question_files().values():
+                    for collection in data['question_collections']:
+                        for question in collection['questions']:
+                            st.session_state.pop(f"{question['_storage_key']}_answer", None)
+                st.rerun()
+        with col2:
+            if st.button("Cancel"):
+                st.session_state.confirm_reset = False
+                st.rerun()
 
 def create_questionnaire_page_function(page_key: str, data: Dict):
     """Create a unique questionnaire page function"""
     def questionnaire_page_func():
         # Display questionnaire header
-        title = data.get('questionnaire_info', {}).get('title', page_key)
-        st.title(title)
+        st.title(data['_title'])
         
-        if data.get('questionnaire_info', {}).get('description'):
-            st.write(f"**Description:** {data['questionnaire_info']['description']}")
+        questionnaire_info = data['questionnaire_info']
+        if questionnaire_info.get('description'):
+            st.write(f"**Description:** {questionnaire_info['description']}")
         
         # Display version and creation info
-        questionnaire_info = data.get('questionnaire_info', {})
         info_parts = []
         if questionnaire_info.get('version'):
             info_parts.append(f"Version: {questionnaire_info['version']}")
@@ -429,7 +558,7 @@ def create_questionnaire_page_function(page_key: str, data: Dict):
             st.write("---")
 
         # Add progress overview and reset functionality in the sidebar
-        processor = QuestionnaireProcessor(load_question_files())
+        processor = get_processor()
         with st.sidebar:
             _display_progress_section(processor)
             _display_reset_section()
@@ -457,9 +586,8 @@ def main():
     
     # Add questionnaire pages with unique identifiers
     for page_key, data in question_files.items():
-        title = data.get('questionnaire_info', {}).get('title', page_key)
         page_func = create_questionnaire_page_function(page_key, data)
-        pages.append(st.Page(page_func, title=title, icon="📝", url_path=f"questionnaire_{page_key}"))
+        pages.append(st.Page(page_func, title=data['_title'], icon="📝", url_path=f"questionnaire_{page_key}"))
     
     # Run navigation
     pg = st.navigation(pages)